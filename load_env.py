@@ -7,35 +7,33 @@ to make it easy to configure the API keys and other settings.
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 
+# One KEY=VALUE assignment per line; comments and other lines don't match
+_ENV_LINE_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
 def load_env_file(env_path):
     """Load environment variables from a file."""
     if not os.path.exists(env_path):
         print(f"Environment file not found: {env_path}")
         return False
     
-    with open(env_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-                
-            # Parse key-value pairs
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes if present
-                if value and (value[0] == value[-1] == '"' or value[0] == value[-1] == "'"):
-                    value = value[1:-1]
-                    
-                # Set environment variable
-                os.environ[key] = value
-                print(f"Set environment variable: {key}")
+    parsed = {}
+    data = Path(env_path).read_text()
+    for match in _ENV_LINE_RE.finditer(data):
+        key, value = match.groups()
+        
+        # Remove quotes if present
+        if len(value) > 1 and value.startswith(('"', "'")) and value.endswith(value[0]):
+            value = value[1:-1]
+            
+        parsed[key] = value
+    
+    # Set all environment variables at once
+    os.environ.update(parsed)
+    print(f"Set {len(parsed)} environment variables")
     
     return True
 
@@ -5,222 +5,847 @@
 
 import os
 import argparse
+import asyncio
+import copy
+import functools
+import hashlib
+import importlib
+import importlib.util
 import json
 from datetime import datetime
 import re
 from pathlib import Path
 import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-# Import the environment variable loader
-try:
-    from load_env import main as load_env
-    # Try to load environment variables
-    load_env()
-except ImportError:
-    print("Environment loader not found. OpenAI features may not work.")
+# Heavy packages (python-docx, OpenAI, spaCy) are only checked for here and imported
+# the first time they're needed, so startup and --help stay fast.
+def _is_installed(package):
+    return importlib.util.find_spec(package) is not None
 
 # We'll use these libraries (will need to be installed via requirements.txt)
-try:
-    import docx
-    from docx import Document
-    from PyPDF2 import PdfReader, PdfWriter
-except ImportError:
+if not _is_installed("docx"):
     print("Some required packages are missing. Please run 'pip install -r requirements.txt'")
     exit(1)
 
 # Make OpenAI optional
+OPENAI_AVAILABLE = _is_installed("openai")
+if not OPENAI_AVAILABLE:
+    print("OpenAI package not available. AI features will be disabled.")
+
+# Make PDF text extraction optional; pypdfium2 (native PDFium) is preferred over PyPDF2
+PDFIUM_AVAILABLE = _is_installed("pypdfium2")
+PYPDF2_AVAILABLE = _is_installed("PyPDF2")
+
+# Make OpenAI rate limiting optional; without it only the number of in-flight requests is capped
 try:
-    import openai
-    OPENAI_AVAILABLE = True
+    from aiolimiter import AsyncLimiter
+    AIOLIMITER_AVAILABLE = True
 except ImportError:
-    print("OpenAI package not available. AI features will be disabled.")
-    OPENAI_AVAILABLE = False
+    AIOLIMITER_AVAILABLE = False
 
-# Make spaCy optional
+# Make Aho-Corasick keyword matching optional; a regex is used without it
 try:
-    import spacy
-    SPACY_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Make config validation optional; jsonschema is only imported when a config file is given
+JSONSCHEMA_AVAILABLE = _is_installed("jsonschema")
+
+# Make spaCy optional
+SPACY_AVAILABLE = _is_installed("spacy")
+if not SPACY_AVAILABLE:
     print("spaCy not available. Using basic text processing.")
-    SPACY_AVAILABLE = False
+
+# spaCy pipeline used for entity extraction; whether it's installed is checked without
+# loading its weights
+SPACY_MODEL = "en_core_web_sm"
+SPACY_MODEL_AVAILABLE = SPACY_AVAILABLE and _is_installed(SPACY_MODEL)
+
+# Expected shape of the --config file. Unknown keys are allowed.
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "input_paths": {
+            "type": "object",
+            "additionalProperties": {"type": "string"}
+        },
+        "output_path": {"type": "string"},
+        "default_files": {
+            "type": "object",
+            "additionalProperties": {"type": "string"}
+        },
+        "max_workers": {"type": ["integer", "null"], "minimum": 1},
+        "openai_settings": {
+            "type": "object",
+            "properties": {
+                "model": {"type": "string"},
+                "temperature": {"type": "number", "minimum": 0, "maximum": 2},
+                "max_tokens": {"type": "integer", "minimum": 1},
+                "use_batch_api": {"type": "boolean"},
+                "requests_per_minute": {"type": "number", "exclusiveMinimum": 0}
+            }
+        },
+        "file_formats": {
+            "type": "object",
+            "properties": {
+                "output_format": {"type": "string"},
+                "filename_template": {"type": "string"}
+            }
+        },
+        "placeholders": {
+            "type": "object",
+            "properties": {
+                "company_name": {"type": "string"},
+                "position_title": {"type": "string"},
+                "custom_placeholders": {
+                    "type": "object",
+                    "additionalProperties": {"type": "string"}
+                }
+            }
+        }
+    }
+}
+
+@functools.lru_cache(maxsize=None)
+def _config_validator():
+    """Validator for _CONFIG_SCHEMA, built on first use (None without jsonschema)"""
+    if not JSONSCHEMA_AVAILABLE:
+        return None
+    return importlib.import_module("jsonschema").Draft202012Validator(_CONFIG_SCHEMA)
+
+# Patterns used to pull basic info out of job descriptions. Each set is compiled into
+# one alternation so the text is scanned once; the earliest match in the text wins.
+_COMPANY_RE = re.compile("|".join(f"(?:{p})" for p in (
+    r"(?:at|with|for|join)\s+([A-Z][A-Za-z0-9\s&]+)(?:,|\.|is|\n)",
+    r"About ([A-Z][A-Za-z0-9\s&]+)(?:,|\.|:|\n)",
+    r"([A-Z][A-Za-z0-9\s&]+) is looking for"
+)))
+
+_TITLE_RE = re.compile("|".join(f"(?:{p})" for p in (
+    r"(?:hiring|for|seeking)(?: a| an)? ([A-Za-z]+\s[A-Za-z]+(?:\s[A-Za-z]+)?) (?:to|who|that)",
+    r"([A-Za-z]+\s[A-Za-z]+(?:\s[A-Za-z]+)?)(?: position)",
+    r"(?:Job Title|Title|Position):?\s*([A-Za-z]+\s[A-Za-z]+(?:\s[A-Za-z]+)?)"
+)))
+
+def _matched_group(match):
+    """Text captured by whichever alternative of a combined pattern matched
+    
+    Each alternative has exactly one capturing group, so the last group that took part
+    in the match is the one to return.
+    """
+    return match.group(match.lastindex)
+
+@functools.lru_cache(maxsize=8)
+def _placeholder_pattern(placeholders):
+    """Compiled alternation matching any of the given placeholders
+    
+    Cached, since the same set of placeholders is used for every job. Longest first so
+    no placeholder shadows another that starts with it.
+    """
+    return re.compile("|".join(re.escape(p) for p in sorted(placeholders, key=len, reverse=True)))
+
+# Common programming languages, tools, etc.
+_TECH_KEYWORDS = ("Python", "JavaScript", "Java", "C++", "React", "Angular",
+                  "Node.js", "SQL", "AWS", "Docker", "Kubernetes", "CI/CD",
+                  "Machine Learning", "Data Science", "Project Management")
+
+# Lowercase form -> display form, so matches come back in canonical casing
+_TECH_DISPLAY = {k.lower(): k for k in _TECH_KEYWORDS}
+
+# Single alternation over all keywords as whole words; longest first so "JavaScript"
+# wins over "Java". Lookarounds instead of \b so keywords ending in "+" still match.
+_TECH_KEYWORDS_RE = re.compile(
+    r"(?<!\w)(?:" + "|".join(re.escape(k) for k in sorted(_TECH_KEYWORDS, key=len, reverse=True)) + r")(?!\w)",
+    re.IGNORECASE
+)
+
+# Aho-Corasick automaton over the lowercased keywords: finds all of them in one pass
+_TECH_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _TECH_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _TECH_KEYWORDS:
+        _TECH_AUTOMATON.add_word(_keyword.lower(), _keyword)
+    _TECH_AUTOMATON.make_automaton()
+
+def _is_word_char(char):
+    return char.isalnum() or char == "_"
+
+def _find_tech_keywords(text):
+    """Yield (keyword, position) for each whole-word tech keyword in text
+    
+    The scan itself runs in C either way (pyahocorasick or the re engine); only the
+    matches reach Python code.
+    """
+    if _TECH_AUTOMATON is None:
+        for match in _TECH_KEYWORDS_RE.finditer(text):
+            yield _TECH_DISPLAY[match.group(0).lower()], match.start()
+        return
+    
+    lowered = text.lower()
+    for end, keyword in _TECH_AUTOMATON.iter(lowered):
+        start = end - len(keyword) + 1
+        # Same whole-word rule as _TECH_KEYWORDS_RE
+        if start > 0 and _is_word_char(lowered[start - 1]):
+            continue
+        if end + 1 < len(lowered) and _is_word_char(lowered[end + 1]):
+            continue
+        yield keyword, start
+
+# WordprocessingML tags read when extracting plain text from a DOCX body
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY, _W_P, _W_R, _W_HYPERLINK, _W_T = (_W_NS + t for t in ("body", "p", "r", "hyperlink", "t"))
+_W_TAB, _W_PTAB, _W_BR, _W_CR, _W_NO_BREAK_HYPHEN = (
+    _W_NS + t for t in ("tab", "ptab", "br", "cr", "noBreakHyphen")
+)
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+def _docx_paragraph_runs(p):
+    """Yield the runs of a DOCX paragraph element that python-docx counts as its text
+    
+    These are the direct w:r children and the runs of hyperlinks; runs nested in other
+    elements (tracked insertions, content controls, text boxes) are left out, as in
+    python-docx.
+    """
+    for child in p.iterchildren(_W_R, _W_HYPERLINK):
+        if child.tag == _W_R:
+            yield child
+        else:
+            yield from child.iterchildren(_W_R)
+
+def _docx_paragraph_text(p):
+    """Text of a DOCX paragraph element, the same as python-docx's Paragraph.text
+    
+    Reads the XML directly rather than building python-docx Paragraph/Run objects.
+    """
+    parts = []
+    for run in _docx_paragraph_runs(p):
+        for el in run.iterchildren(_W_T, _W_TAB, _W_PTAB, _W_BR, _W_CR, _W_NO_BREAK_HYPHEN):
+            if el.tag == _W_T:
+                parts.append(el.text or "")
+            elif el.tag in (_W_TAB, _W_PTAB):
+                parts.append("\t")
+            elif el.tag == _W_NO_BREAK_HYPHEN:
+                parts.append("-")
+            elif el.tag == _W_CR or el.get(_W_NS + "type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+    return "".join(parts)
+
+def _docx_paragraph_texts(doc):
+    """Yield (paragraph element, text) for every paragraph of a DOCX body, in document order
+    
+    Unlike doc.paragraphs this includes the paragraphs in tables and text boxes.
+    """
+    for p in doc.element.body.iter(_W_P):
+        yield p, _docx_paragraph_text(p)
+
+@functools.lru_cache(maxsize=8)
+def _cached_docx(path_str, mtime_ns):
+    """Parsed DOCX document, reused while the file is unchanged
+    
+    The modification time is part of the key so editing a template invalidates it.
+    Callers must not modify the result; tailor_cover_letter edits a deep copy.
+    """
+    return importlib.import_module("docx").Document(path_str)
+
+# Supported template formats, in order of preference when picking an input file
+RESUME_SUFFIXES = (".docx", ".pdf", ".txt")
+COVER_LETTER_SUFFIXES = (".docx", ".txt")
+
+def _find_inputs(directory, suffixes):
+    """List the files in a directory with one of the given suffixes
+    
+    Uses a single directory scan; files are ordered by suffix preference, then name.
+    """
+    found = {suffix: [] for suffix in suffixes}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix in found and entry.is_file():
+                    found[suffix].append(Path(entry.path))
+    except FileNotFoundError:
+        return []
+    return [path for suffix in suffixes for path in sorted(found[suffix])]
+
+# Bump when the extraction logic changes so stale cached job info is ignored
+JOB_INFO_CACHE_VERSION = 4
+
+# Number of texts spaCy processes at a time when analyzing several job descriptions;
+# larger on a GPU, where small batches leave it mostly idle
+SPACY_BATCH_SIZE = 32
+SPACY_GPU_BATCH_SIZE = 128
+
+# Default number of job description characters run through spaCy; override with TAILOR_NLP_MAXCHARS
+NLP_MAX_CHARS = 8000
+
+# Number of job description and resume characters included in OpenAI prompts, to stay
+# within token limits
+PROMPT_EXCERPT_CHARS = 2000
+
+# Bump when the way OpenAI replies are parsed or used changes so cached replies are ignored
+OPENAI_CACHE_VERSION = 1
+
+# Model used for tailoring suggestions
+OPENAI_MODEL = "gpt-3.5-turbo"
+
+# Number of jobs combined into each OpenAI request when processing a batch of jobs
+JOBS_PER_REQUEST = 5
+
+# Maximum number of OpenAI requests in flight when tailoring several jobs at once
+OPENAI_MAX_CONCURRENCY = 8
+
+# Default OpenAI request rate limit (needs aiolimiter); override with openai_settings.requests_per_minute
+OPENAI_REQUESTS_PER_MINUTE = 60
+
+def _reply_jobs(reply):
+    """The "jobs" list of a combined OpenAI reply (see _batch_prompt), or None if it's malformed"""
+    try:
+        jobs = json.loads(reply).get("jobs")
+    except (ValueError, TypeError, AttributeError):
+        return None
+    return jobs if isinstance(jobs, list) else None
 
 class DocumentTailorer:
     def __init__(self, config=None):
         self.config = config or {}
         self.input_dir = Path("input")
         self.output_dir = Path("output")
+        self.cache_dir = Path(".cache")
         
-        # Initialize NLP model if available
-        self.nlp = None
-        if SPACY_AVAILABLE:
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except:
-                print("spaCy model not found. Using basic text processing.")
+        # The NLP model is loaded on first use (see the nlp property)
+        self._nlp = None
+        self._nlp_loaded = False
+        self._spacy_batch_size = SPACY_BATCH_SIZE
+        # spaCy only sees the start of each job description; the company and the
+        # products named there are what _extract_keywords needs from it
+        try:
+            self._nlp_max_chars = int(os.environ.get("TAILOR_NLP_MAXCHARS", ""))
+        except ValueError:
+            self._nlp_max_chars = NLP_MAX_CHARS
+        if self._nlp_max_chars <= 0:
+            self._nlp_max_chars = NLP_MAX_CHARS
             
-        # Initialize OpenAI if API key is present
-        self.openai_available = False
-        if OPENAI_AVAILABLE and "OPENAI_API_KEY" in os.environ:
-            openai.api_key = os.environ["OPENAI_API_KEY"]
-            self.openai_available = True
+        # OpenAI is used if an API key is present; the client is set up on first request
+        self.openai_available = OPENAI_AVAILABLE and "OPENAI_API_KEY" in os.environ
+        self._openai_client = None
         
-    def load_resume(self, resume_path):
-        """Load a resume file (PDF or DOCX)"""
-        resume_path = str(resume_path)  # Convert Path to string
-        if resume_path.endswith('.pdf'):
-            # Logic for PDF resumes will go here
-            return {"type": "pdf", "path": resume_path, "content": "PDF content extraction"}
-        elif resume_path.endswith('.docx'):
-            doc = Document(resume_path)
-            content = "\n".join([para.text for para in doc.paragraphs if para.text])
-            return {"type": "docx", "path": resume_path, "content": content, "document": doc}
-        elif resume_path.endswith('.txt'):
-            with open(resume_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return {"type": "txt", "path": resume_path, "content": content}
+        # Threads used to write a job's documents concurrently, started on first save
+        self._save_executor = None
+    
+    @property
+    def nlp(self):
+        """spaCy model, loaded on first access (None if spaCy or the model is unavailable)"""
+        if not self._nlp_loaded:
+            self._nlp_loaded = True
+            if SPACY_AVAILABLE:
+                spacy = importlib.import_module("spacy")
+                # Opt-in, since the model is loaded once per worker process; falls back
+                # to the CPU if no GPU is usable
+                if os.environ.get("TAILOR_USE_GPU") == "1" and spacy.prefer_gpu():
+                    self._spacy_batch_size = SPACY_GPU_BATCH_SIZE
+                try:
+                    # Only NER is used (see _extract_keywords), so the other components
+                    # are excluded and their weights never loaded. That includes the shared
+                    # tok2vec: in en_core_web_sm only the tagger and parser listen to it,
+                    # while ner has its own embedding layer.
+                    self._nlp = spacy.load(
+                        SPACY_MODEL,
+                        exclude=["tok2vec", "parser", "tagger", "attribute_ruler", "lemmatizer"]
+                    )
+                except:
+                    print("spaCy model not found. Using basic text processing.")
+        return self._nlp
+    
+    def _openai(self):
+        """OpenAI client, created on first use"""
+        if self._openai_client is None:
+            openai = importlib.import_module("openai")
+            self._openai_client = openai.OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+        return self._openai_client
+        
+    def _load_docx(self, path):
+        doc = _cached_docx(str(path), os.stat(path).st_mtime_ns)
+        # Kept so tailoring can tell which paragraphs (tables included) need changes
+        # without re-reading them
+        paragraphs = list(_docx_paragraph_texts(doc))
+        paragraph_texts = [text for _, text in paragraphs]
+        # The plain-text content is the top-level paragraphs, as in doc.paragraphs
+        content = "\n".join(text for p, text in paragraphs if text and p.getparent().tag == _W_BODY)
+        return {"type": "docx", "path": path, "content": content, "document": doc,
+                "paragraph_texts": paragraph_texts}
+    
+    def _load_txt(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return {"type": "txt", "path": path, "content": content}
+    
+    def _load_pdf(self, path):
+        # Text is pulled one page at a time so only the current page is held in memory
+        if PDFIUM_AVAILABLE:
+            pdfium = importlib.import_module("pypdfium2")
+            pdf = pdfium.PdfDocument(path)
+            try:
+                pages = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    pages.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        elif PYPDF2_AVAILABLE:
+            reader = importlib.import_module("PyPDF2").PdfReader(path)
+            pages = [page.extract_text() or "" for page in reader.pages]
         else:
-            raise ValueError(f"Unsupported resume format: {resume_path}")
+            print("No PDF library available. Install pypdfium2 to read PDF resumes.")
+            pages = []
+        return {"type": "pdf", "path": path, "content": "\n".join(pages)}
+    
+    # File suffix -> loader
+    _LOADERS = {".docx": _load_docx, ".txt": _load_txt, ".pdf": _load_pdf}
+    
+    def _load(self, path, kind, suffixes):
+        """Load a document with the loader registered for its file suffix"""
+        suffix = Path(path).suffix.lower()
+        if suffix not in suffixes:
+            raise ValueError(f"Unsupported {kind} format: {path}")
+        return self._LOADERS[suffix](self, str(path))
+    
+    def load_resume(self, resume_path):
+        """Load a resume file (PDF, DOCX or TXT)"""
+        return self._load(resume_path, "resume", RESUME_SUFFIXES)
     
     def load_cover_letter(self, cover_letter_path):
-        """Load a cover letter template file (PDF or DOCX)"""
-        # Similar to load_resume method
-        cover_letter_path = str(cover_letter_path)  # Convert Path to string
-        if cover_letter_path.endswith('.docx'):
-            doc = Document(cover_letter_path)
-            content = "\n".join([para.text for para in doc.paragraphs if para.text])
-            return {"type": "docx", "path": cover_letter_path, "content": content, "document": doc}
-        elif cover_letter_path.endswith('.txt'):
-            with open(cover_letter_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return {"type": "txt", "path": cover_letter_path, "content": content}
-        else:
-            raise ValueError(f"Unsupported cover letter format: {cover_letter_path}")
+        """Load a cover letter template file (DOCX or TXT)"""
+        return self._load(cover_letter_path, "cover letter", COVER_LETTER_SUFFIXES)
     
     def load_job_description(self, job_desc_path):
         """Load a job description file"""
-        with open(job_desc_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        return self.load_job_descriptions([job_desc_path])[0]
+    
+    def load_job_descriptions(self, job_desc_paths):
+        """Load several job description files
         
-        # Basic info extraction
-        job_info = {
-            "full_text": content,
-            "company": self._extract_company(content),
-            "job_title": self._extract_job_title(content),
-            "keywords": self._extract_keywords(content)
-        }
+        Descriptions not found in the cache are run through spaCy together with nlp.pipe,
+        which is much faster than one call per text.
+        """
+        job_infos = []
+        contents = []
+        cache_paths = []
+        for job_desc_path in job_desc_paths:
+            with open(job_desc_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            
+            contents.append(content)
+            job_infos.append({
+                "full_text": content,
+                # Only the start of the description is sent to OpenAI
+                "prompt_text": content[:PROMPT_EXCERPT_CHARS]
+            })
+            
+            # Keyed on the spaCy model rather than the package: entities are only found
+            # once the model is installed
+            cache_key = f"{JOB_INFO_CACHE_VERSION}:{SPACY_MODEL_AVAILABLE}:{self._nlp_max_chars}:{content}"
+            digest = hashlib.blake2b(cache_key.encode('utf-8'), digest_size=16).hexdigest()
+            cache_paths.append(self.cache_dir / "job_info" / f"{digest}.json")
+        
+        # Reuse info extracted on a previous run if the file hasn't changed
+        missing = []
+        for i, cache_path in enumerate(cache_paths):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    job_infos[i].update(json.load(f))
+            except (OSError, ValueError):
+                missing.append(i)
+        
+        if not missing:
+            return job_infos
+        
+        docs = [None] * len(missing)
+        if self.nlp:
+            docs = self.nlp.pipe((contents[i][:self._nlp_max_chars] for i in missing),
+                                 batch_size=self._spacy_batch_size)
         
-        return job_info
+        for i, doc in zip(missing, docs):
+            # Basic info extraction
+            content = contents[i]
+            extracted = {
+                "company": self._extract_company(content),
+                "job_title": self._extract_job_title(content),
+                "keywords": self._extract_keywords(content, doc)
+            }
+            
+            job_infos[i].update(extracted)
+            
+            # Installed but failed to load (e.g. built for another spaCy version): the
+            # results lack entities, so don't store them under the model's key
+            if SPACY_MODEL_AVAILABLE and not self.nlp:
+                continue
+            try:
+                os.makedirs(cache_paths[i].parent, exist_ok=True)
+                with open(cache_paths[i], 'w', encoding='utf-8') as f:
+                    json.dump(extracted, f)
+            except OSError as e:
+                print(f"Could not write job info cache: {e}")
+        
+        return job_infos
     
     def _extract_company(self, text):
         """Attempt to extract company name from job description"""
         # Simplified approach - could be improved with ML
-        company_patterns = [
-            r"(?:at|with|for|join)\s+([A-Z][A-Za-z0-9\s&]+)(?:,|\.|is|\n)",
-            r"About ([A-Z][A-Za-z0-9\s&]+)(?:,|\.|:|\n)",
-            r"([A-Z][A-Za-z0-9\s&]+) is looking for"
-        ]
-        
-        for pattern in company_patterns:
-            matches = re.search(pattern, text)
-            if matches:
-                return matches.group(1).strip()
+        matches = _COMPANY_RE.search(text)
+        if matches:
+            return _matched_group(matches).strip()
         
         return "COMPANY_NAME"
     
     def _extract_job_title(self, text):
         """Attempt to extract job title from job description"""
         # Look for common job title patterns
-        title_patterns = [
-            r"(?:hiring|for|seeking)(?: a| an)? ([A-Za-z]+\s[A-Za-z]+(?:\s[A-Za-z]+)?) (?:to|who|that)",
-            r"([A-Za-z]+\s[A-Za-z]+(?:\s[A-Za-z]+)?)(?: position)",
-            r"(?:Job Title|Title|Position):?\s*([A-Za-z]+\s[A-Za-z]+(?:\s[A-Za-z]+)?)"
-        ]
-        
-        for pattern in title_patterns:
-            matches = re.search(pattern, text)
-            if matches:
-                return matches.group(1).strip()
+        matches = _TITLE_RE.search(text)
+        if matches:
+            return _matched_group(matches).strip()
         
         return "POSITION_TITLE"
     
-    def _extract_keywords(self, text):
-        """Extract important keywords from the job description"""
-        skills = set()
+    def _extract_keywords(self, text, doc=None):
+        """Extract important keywords from the job description
         
-        if self.nlp:
+        doc is the spaCy Doc for the start of text if it has already been computed.
+        Keywords are returned in the order they first appear in the text.
+        """
+        # Keyword -> position of its first occurrence
+        skills = {}
+        
+        if doc is None and self.nlp:
             # Use spaCy if available
-            doc = self.nlp(text)
+            doc = self.nlp(text[:self._nlp_max_chars])
+        if doc is not None:
             for ent in doc.ents:
                 if ent.label_ in ["ORG", "PRODUCT"]:
-                    skills.add(ent.text)
-        else:
-            # Basic keyword extraction using regex
-            # Look for common technical terms
-            tech_terms = r'\b(Python|JavaScript|Java|C\+\+|React|Angular|Node\.js|SQL|AWS|Docker|Kubernetes|CI/CD|Machine Learning|Data Science|Project Management)\b'
-            matches = re.finditer(tech_terms, text, re.IGNORECASE)
-            for match in matches:
-                skills.add(match.group(0))
-        
-        # Add common programming languages, tools, etc.
-        tech_keywords = ["Python", "JavaScript", "Java", "C++", "React", "Angular", 
-                        "Node.js", "SQL", "AWS", "Docker", "Kubernetes", "CI/CD",
-                        "Machine Learning", "Data Science", "Project Management"]
-        
-        for keyword in tech_keywords:
-            if keyword.lower() in text.lower():
-                skills.add(keyword)
+                    skills.setdefault(ent.text, ent.start_char)
+        
+        # Look for common technical terms in a single pass over the text; only the first
+        # occurrence of each matters, so the scan stops once every keyword has been seen
+        found = set()
+        for keyword, position in _find_tech_keywords(text):
+            if keyword in found:
+                continue
+            found.add(keyword)
+            skills[keyword] = min(skills.get(keyword, position), position)
+            if len(found) == len(_TECH_KEYWORDS):
+                break
                 
-        return list(skills)
+        return sorted(skills, key=skills.get)
     
-    def tailor_resume(self, resume_data, job_data):
-        """Generate a tailored resume based on the job description"""
-        # In a real implementation, this would reorder skills, highlight relevant experience, etc.
-        # For now, we'll just make a copy of the original
-        
-        if self.openai_available:
-            prompt = f"""
+    def _resume_prompt(self, resume_data, job_data):
+        """Build the OpenAI prompt asking for resume tailoring suggestions"""
+        return f"""
             Analyze this job description and suggest 5-7 specific modifications to make the resume more relevant:
             
             JOB DESCRIPTION:
-            {job_data['full_text'][:2000]}  # Truncated to avoid token limits
+            {job_data['prompt_text']}
             
             RESUME:
-            {resume_data['content'][:2000]}  # Truncated to avoid token limits
+            {resume_data['content'][:PROMPT_EXCERPT_CHARS]}
             
             Please provide specific suggestions in the format:
             1. [SECTION] - [SPECIFIC CHANGE RECOMMENDATION]
             """
+    
+    def _batch_prompt(self, resume_data, jobs):
+        """Build one OpenAI prompt covering several jobs that share the same resume"""
+        job_sections = "\n".join(f"""
+            JOB {json.dumps(job_name)}:
+            {job_data['prompt_text']}
+            """ for job_name, job_data in jobs.items())
+        return f"""
+            For each job description below, suggest 5-7 specific modifications to make the resume more relevant,
+            and write a short phrase completing the cover letter sentence "What attracts me to the company is ...".
             
+            RESUME:
+            {resume_data['content'][:PROMPT_EXCERPT_CHARS]}
+            {job_sections}
+            Reply with a JSON object of the form
+            {{"jobs": [{{"id": "<job id>", "resume_suggestions": "1. [SECTION] - [SPECIFIC CHANGE RECOMMENDATION]\\n2. ...", "cover_paragraph": "..."}}]}}
+            with one entry per job, using the job ids given above.
+            """
+    
+    def _chat_request(self, prompt, json_reply=False):
+        """Request body for a chat completion, optionally asking for a JSON object reply"""
+        body = {"model": OPENAI_MODEL, "messages": [{"role": "user", "content": prompt}]}
+        if json_reply:
+            body["response_format"] = {"type": "json_object"}
+        return body
+    
+    def _suggestions_cache_path(self, body):
+        """Location of the cached OpenAI reply for a request body
+        
+        The body holds the full prompt (resume, job descriptions and instructions), so any
+        change to those is a cache miss.
+        """
+        key = hashlib.sha256(
+            f"{OPENAI_CACHE_VERSION}:{json.dumps(body, sort_keys=True)}".encode('utf-8')
+        ).hexdigest()
+        return self.cache_dir / "openai" / f"{key}.txt"
+    
+    def _read_cached_suggestions(self, cache_path, validate=None):
+        """Return a cached OpenAI reply, or None if there isn't one (or it fails validate)"""
+        try:
+            suggestions = cache_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+        if validate is not None and not validate(suggestions):
+            return None
+        return suggestions
+    
+    def _write_cached_suggestions(self, cache_path, suggestions, validate=None):
+        """Store an OpenAI reply so identical prompts skip the API on later runs
+        
+        Replies that fail validate are not stored, so the request is retried next time.
+        """
+        if validate is not None and not validate(suggestions):
+            return
+        try:
+            os.makedirs(cache_path.parent, exist_ok=True)
+            cache_path.write_text(suggestions, encoding='utf-8')
+        except OSError as e:
+            print(f"Could not write OpenAI cache: {e}")
+    
+    def _request_suggestions(self, body, validate=None):
+        """Send a request to OpenAI and return the reply, or an empty string if the call failed
+        
+        validate, if given, is called with the reply text; only replies it accepts are cached.
+        """
+        cache_path = self._suggestions_cache_path(body)
+        suggestions = self._read_cached_suggestions(cache_path, validate)
+        if suggestions is not None:
+            return suggestions
+        
+        try:
+            response = self._openai().chat.completions.create(**body)
+            suggestions = response.choices[0].message.content
+            if suggestions is None:
+                raise ValueError("the reply has no content")
+        except Exception as e:
+            print(f"OpenAI API call failed: {e}")
+            return ""
+        
+        self._write_cached_suggestions(cache_path, suggestions, validate)
+        return suggestions
+    
+    async def _request_suggestions_async(self, client, body, semaphore, limiter=None, validate=None):
+        """Async version of _request_suggestions, throttled by the given semaphore and rate limiter"""
+        cache_path = self._suggestions_cache_path(body)
+        suggestions = self._read_cached_suggestions(cache_path, validate)
+        if suggestions is not None:
+            return suggestions
+        
+        async with semaphore:
             try:
-                response = openai.ChatCompletion.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": prompt}]
-                )
+                if limiter is not None:
+                    await limiter.acquire()
+                response = await client.chat.completions.create(**body)
                 suggestions = response.choices[0].message.content
-                print("\nTailoring suggestions:\n" + suggestions)
+                if suggestions is None:
+                    raise ValueError("the reply has no content")
             except Exception as e:
                 print(f"OpenAI API call failed: {e}")
-                suggestions = "API call failed"
+                return ""
+        
+        self._write_cached_suggestions(cache_path, suggestions, validate)
+        return suggestions
+    
+    def _request_all(self, requests, validate=None):
+        """Send several OpenAI requests concurrently
+        
+        Takes a dict of id -> request body and returns a dict of id -> reply; validate is as
+        for _request_suggestions. Uses the Batch API instead when "use_batch_api" is set in
+        the openai_settings config.
+        """
+        if self.config.get("openai_settings", {}).get("use_batch_api"):
+            return self._request_all_batch_api(requests, validate)
+        
+        async def gather_all():
+            semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+            limiter = None
+            if AIOLIMITER_AVAILABLE:
+                rate = self.config.get("openai_settings", {}).get("requests_per_minute", OPENAI_REQUESTS_PER_MINUTE)
+                if rate >= 1:
+                    limiter = AsyncLimiter(rate, 60)
+                elif rate > 0:
+                    # A limiter can't hold less than one request, so below one a minute
+                    # single requests are spaced out instead
+                    limiter = AsyncLimiter(1, 60 / rate)
+            openai = importlib.import_module("openai")
+            async with openai.AsyncOpenAI(api_key=os.environ["OPENAI_API_KEY"]) as client:
+                return await asyncio.gather(*[
+                    self._request_suggestions_async(client, body, semaphore, limiter, validate)
+                    for body in requests.values()
+                ])
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return dict(zip(requests, asyncio.run(gather_all())))
+        # Called from inside an event loop (e.g. a notebook), where asyncio.run isn't
+        # allowed; run the requests on a loop of their own in another thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return dict(zip(requests, executor.submit(asyncio.run, gather_all()).result()))
+    
+    def _request_all_batch_api(self, requests, validate=None):
+        """Send several OpenAI requests through the Batch API
+        
+        Batch requests cost half as much but may take a long time to complete; this blocks,
+        polling until the batch is done. Requests that failed get an empty string.
+        """
+        replies = {}
+        pending = {}
+        for request_id, body in requests.items():
+            cache_path = self._suggestions_cache_path(body)
+            cached = self._read_cached_suggestions(cache_path, validate)
+            if cached is not None:
+                replies[request_id] = cached
+            else:
+                pending[request_id] = (body, cache_path)
+        
+        if not pending:
+            return replies
+        
+        batch_input = "\n".join(json.dumps({
+            "custom_id": request_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body
+        }) for request_id, (body, _) in pending.items())
+        
+        client = self._openai()
+        try:
+            batch_file = client.files.create(file=("requests.jsonl", batch_input.encode('utf-8')), purpose="batch")
+            batch = client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions",
+                                          completion_window="24h")
+            print(f"Submitted OpenAI batch {batch.id} with {len(pending)} requests, waiting for results...")
+            
+            delay = 5
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(delay)
+                delay = min(delay * 2, 300)
+                batch = client.batches.retrieve(batch.id)
+            
+            output = ""
+            if batch.output_file_id:
+                output = client.files.content(batch.output_file_id).text
+            if batch.status != "completed":
+                print(f"OpenAI batch {batch.id} finished with status: {batch.status}")
+        except Exception as e:
+            print(f"OpenAI batch request failed: {e}")
+            output = ""
+        
+        for line in output.splitlines():
+            try:
+                result = json.loads(line)
+                request_id = result["custom_id"]
+                response = result.get("response") or {}
+                if request_id not in pending or response.get("status_code") != 200:
+                    continue
+                reply = response["body"]["choices"][0]["message"]["content"]
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+                print(f"Skipping unreadable line in the OpenAI batch output: {line[:80]}")
+                continue
+            if not isinstance(reply, str):
+                continue
+            self._write_cached_suggestions(pending[request_id][1], reply, validate)
+            replies[request_id] = reply
+        
+        for request_id in pending:
+            if request_id not in replies:
+                print(f"No OpenAI reply returned for request {request_id}")
+                replies[request_id] = ""
+        
+        return replies
+    
+    def _batch_tailor(self, resume_data, jobs):
+        """Get OpenAI tailoring for many jobs using a few combined requests
+        
+        Jobs are grouped JOBS_PER_REQUEST at a time into one prompt each, so the resume is only
+        sent once per group. Takes a dict of job name -> job data and returns a dict of
+        job name -> {"resume_suggestions": ..., "cover_paragraph": ...}; a job whose reply was
+        missing or unreadable gets empty strings.
+        """
+        if not self.openai_available or not jobs:
+            return {}
+        
+        job_names = list(jobs)
+        groups = [job_names[i:i + JOBS_PER_REQUEST] for i in range(0, len(job_names), JOBS_PER_REQUEST)]
+        requests = {
+            str(index): self._chat_request(
+                self._batch_prompt(resume_data, {job_name: jobs[job_name] for job_name in group}),
+                json_reply=True
+            )
+            for index, group in enumerate(groups)
+        }
+        # Unreadable replies aren't cached, so a rerun asks again
+        replies = self._request_all(requests, validate=lambda reply: _reply_jobs(reply) is not None)
+        
+        precomputed = {job_name: {"resume_suggestions": "", "cover_paragraph": ""} for job_name in job_names}
+        for index, group in enumerate(groups):
+            reply = replies[str(index)]
+            if not reply:
+                continue
+            entries = _reply_jobs(reply)
+            if entries is None:
+                print("Could not parse the OpenAI reply for jobs: " + ", ".join(group))
+                continue
+            
+            for entry in entries:
+                if not isinstance(entry, dict) or entry.get("id") not in group:
+                    continue
+                suggestions = entry.get("resume_suggestions") or ""
+                if isinstance(suggestions, list):
+                    suggestions = "\n".join(str(s) for s in suggestions)
+                precomputed[entry["id"]] = {
+                    "resume_suggestions": str(suggestions),
+                    "cover_paragraph": str(entry.get("cover_paragraph") or "")
+                }
+        
+        return precomputed
+    
+    def tailor_resume(self, resume_data, job_data, suggestions=None):
+        """Generate a tailored resume based on the job description
+        
+        If suggestions were already fetched (see _batch_tailor) they are used
+        instead of making a new OpenAI request.
+        """
+        # In a real implementation, this would reorder skills, highlight relevant experience, etc.
+        # For now, we'll just make a copy of the original
+        
+        if self.openai_available:
+            if suggestions is None:
+                suggestions = self._request_suggestions(
+                    self._chat_request(self._resume_prompt(resume_data, job_data))
+                )
+            if suggestions:
+                print("\nTailoring suggestions:\n" + suggestions)
         
         # For a simple MVP, we'll just copy the original file
         if resume_data['type'] == 'docx':
-            # Create a new document based on the original
-            new_doc = Document()
-            for para in resume_data['document'].paragraphs:
-                new_para = new_doc.add_paragraph(para.text)
-                # Copy formatting (basic)
-                for run in para.runs:
-                    new_run = new_para.add_run(run.text)
-                    new_run.bold = run.bold
-                    new_run.italic = run.italic
-            
-            return {"type": "docx", "document": new_doc}
+            # Nothing in the resume is changed yet, so the template itself is saved; copy it
+            # with copy.deepcopy before making edits here
+            return {"type": "docx", "document": resume_data['document']}
         else:
             # For other types, just return the original content for now
             return {"type": "txt", "content": resume_data['content']}
     
-    def tailor_cover_letter(self, cover_letter_data, job_data):
-        """Generate a tailored cover letter based on the job description"""
+    def tailor_cover_letter(self, cover_letter_data, job_data, cover_paragraph=None):
+        """Generate a tailored cover letter based on the job description
+        
+        cover_paragraph, if given, is OpenAI-written text about what attracts the applicant
+        to the company (see _batch_tailor).
+        """
         # Replace placeholder text in the cover letter
         content = cover_letter_data['content']
         
@@ -239,7 +864,7 @@ class DocumentTailorer:
             "[brief accomplishment that relates to the job]": f"successfully delivered projects using {job_data['keywords'][0] if job_data['keywords'] else 'various technologies'}",
             "[another accomplishment]": "leading multiple successful project deliveries",
             "[relevant skill for the job]": job_data['keywords'][0] if job_data['keywords'] else "deliver high-quality solutions",
-            "[something specific about the company that you admire]": "your focus on innovation and technical excellence",
+            "[something specific about the company that you admire]": cover_paragraph or "your focus on innovation and technical excellence",
             "[mention something specific about their products, services, culture, or mission]": "commitment to delivering high-quality software solutions",
             "[relevant experience]": ", ".join(job_data['keywords'][:2]) if job_data['keywords'] else "software development",
             "[specific relevant knowledge]": job_data['keywords'][0] if job_data['keywords'] else "technical expertise",
@@ -248,55 +873,117 @@ class DocumentTailorer:
             "[your email address]": "YOUR_EMAIL_ADDRESS"
         }
         
-        for placeholder, value in replacements.items():
-            content = content.replace(placeholder, value)
+        # Match every placeholder in one pass
+        placeholder_re = _placeholder_pattern(tuple(replacements))
+        
+        def substitute(text):
+            return placeholder_re.sub(lambda m: replacements[m.group(0)], text)
+        
+        content = substitute(content)
         
         # For a simple MVP, we'll just create a new document with the modified content
         if cover_letter_data['type'] == 'docx':
-            # Create a new document based on the original
-            new_doc = Document()
+            # Copy the original document (the template may be reused for other jobs)
+            new_doc = copy.deepcopy(cover_letter_data['document'])
             
-            # Copy paragraphs from original with replacements
-            for para in cover_letter_data['document'].paragraphs:
-                para_text = para.text
-                for placeholder, value in replacements.items():
-                    para_text = para_text.replace(placeholder, value)
-                
-                new_para = new_doc.add_paragraph(para_text)
-                # Copy formatting (basic)
-                for run in para.runs:
-                    new_run = new_para.add_run(run.text)
-                    new_run.bold = run.bold
-                    new_run.italic = run.italic
+            # Apply replacements in place, only to the paragraphs that contain placeholders;
+            # these are in the same order as _load_docx listed them
+            paragraphs = new_doc.element.body.iter(_W_P)
+            for p, text in zip(paragraphs, cover_letter_data['paragraph_texts']):
+                if placeholder_re.search(text):
+                    self._replace_in_paragraph(p, placeholder_re, replacements)
             
             return {"type": "docx", "document": new_doc}
         else:
             # For other types, just return the modified content
             return {"type": "txt", "content": content}
 
+    def _replace_in_paragraph(self, p, placeholder_re, replacements):
+        """Replace placeholders in the text of a DOCX paragraph element in place
+        
+        Works on the w:t text nodes directly, so run formatting is kept.
+        """
+        # Same text nodes as _docx_paragraph_text, which picked this paragraph
+        texts = [t for run in _docx_paragraph_runs(p) for t in run.iterchildren(_W_T)]
+        for t in texts:
+            if t.text:
+                t.text = placeholder_re.sub(lambda m: replacements[m.group(0)], t.text)
+                t.set(_XML_SPACE, "preserve")
+        
+        # Nothing can be split across runs in the usual single-run paragraph
+        if len(texts) < 2:
+            return
+        
+        # A placeholder split across several runs only shows up in the joined text. Put its
+        # replacement in the first node it starts in and drop the rest of it from the others.
+        # Going backwards keeps the positions of earlier matches valid.
+        joined = "".join(t.text or "" for t in texts)
+        for match in reversed(list(placeholder_re.finditer(joined))):
+            spanned = []
+            pos = 0
+            for t in texts:
+                end = pos + len(t.text or "")
+                if end > match.start() and pos < match.end():
+                    spanned.append((t, pos))
+                pos = end
+            if len(spanned) < 2:
+                continue
+            
+            (first, first_pos), (last, last_pos) = spanned[0], spanned[-1]
+            tail = last.text[match.end() - last_pos:]
+            for t, _ in spanned[1:]:
+                t.text = ""
+            first.text = first.text[:match.start() - first_pos] + replacements[match.group(0)]
+            last.text = (last.text or "") + tail
+            for t, _ in spanned:
+                t.set(_XML_SPACE, "preserve")
+
     def save_document(self, doc_data, output_path):
         """Save the tailored document to the output directory"""
         if doc_data['type'] == 'docx':
             doc_data['document'].save(output_path)
             return output_path
         else:
-            # For text documents
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(doc_data['content'])
+            # For text documents; skip the write if the file already has this content
+            output_path = Path(output_path)
+            try:
+                if output_path.read_text(encoding='utf-8') == doc_data['content']:
+                    return output_path
+            except (OSError, UnicodeDecodeError):
+                pass
+            output_path.write_text(doc_data['content'], encoding='utf-8')
             return output_path
 
+    def _save_documents(self, *documents):
+        """Save (doc_data, output_path) pairs concurrently, each write in its own thread"""
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=2)
+        futures = [self._save_executor.submit(self.save_document, doc_data, output_path)
+                   for doc_data, output_path in documents]
+        return [future.result() for future in futures]
+
     def process_job(self, resume_path, cover_letter_path, job_desc_path, job_name):
         """Process a single job application"""
-        print(f"Processing job: {job_name}")
-        
         # Load input documents
         resume_data = self.load_resume(resume_path)
         cover_letter_data = self.load_cover_letter(cover_letter_path)
+        
+        print(f"Processing job: {job_name}")
         job_data = self.load_job_description(job_desc_path)
         
+        return self.process_job_preloaded(resume_data, cover_letter_data, job_data, job_name)
+    
+    def process_job_preloaded(self, resume_data, cover_letter_data, job_data, job_name, precomputed=None):
+        """Process a single job application using already loaded templates and job data
+        
+        precomputed holds OpenAI output fetched ahead of time (see _batch_tailor).
+        """
+        precomputed = precomputed or {}
+        
         # Generate tailored documents
-        tailored_resume = self.tailor_resume(resume_data, job_data)
-        tailored_cover_letter = self.tailor_cover_letter(cover_letter_data, job_data)
+        tailored_resume = self.tailor_resume(resume_data, job_data, precomputed.get("resume_suggestions"))
+        tailored_cover_letter = self.tailor_cover_letter(cover_letter_data, job_data,
+                                                         precomputed.get("cover_paragraph"))
         
         # Create job-specific output directory
         job_output_dir = self.output_dir / job_name
@@ -306,8 +993,8 @@ class DocumentTailorer:
         resume_output = job_output_dir / f"Resume_{job_data['company']}_{job_name}.txt"
         cover_letter_output = job_output_dir / f"CoverLetter_{job_data['company']}_{job_name}.txt"
         
-        self.save_document(tailored_resume, resume_output)
-        self.save_document(tailored_cover_letter, cover_letter_output)
+        self._save_documents((tailored_resume, resume_output),
+                             (tailored_cover_letter, cover_letter_output))
         
         print(f"Tailored documents saved to {job_output_dir}")
         return {
@@ -316,6 +1003,25 @@ class DocumentTailorer:
             "job_info": job_data
         }
     
+    def _worker_state(self):
+        """Attributes a worker process's tailorer copies from this one (see _init_worker)"""
+        return {"input_dir": self.input_dir, "output_dir": self.output_dir, "cache_dir": self.cache_dir}
+    
+    def _worker_count(self):
+        """Number of worker processes process_all_jobs may use
+        
+        Taken from the max_workers config key, then the TAILOR_WORKERS environment variable;
+        by default one core is left for the main process. Parallelism can hurt on slow
+        disks, where setting either to 1 processes jobs one at a time.
+        """
+        workers = self.config.get("max_workers")
+        if not workers:
+            try:
+                workers = int(os.environ.get("TAILOR_WORKERS", ""))
+            except ValueError:
+                workers = (os.cpu_count() or 1) - 1
+        return max(1, workers)
+    
     def process_all_jobs(self):
         """Process all job descriptions found in the input directory"""
         # Get base resume and cover letter
@@ -324,8 +1030,8 @@ class DocumentTailorer:
         job_desc_dir = self.input_dir / "job_descriptions"
         
         # Find the first resume and cover letter (in a more advanced version, user would select)
-        resume_files = list(resume_dir.glob("*.docx")) + list(resume_dir.glob("*.pdf")) + list(resume_dir.glob("*.txt"))
-        cover_letter_files = list(cover_letter_dir.glob("*.docx")) + list(cover_letter_dir.glob("*.txt"))
+        resume_files = _find_inputs(resume_dir, RESUME_SUFFIXES)
+        cover_letter_files = _find_inputs(cover_letter_dir, COVER_LETTER_SUFFIXES)
         
         if not resume_files:
             print("No resume files found in input/resumes directory.")
@@ -342,27 +1048,112 @@ class DocumentTailorer:
         print(f"Using resume: {resume_path}")
         print(f"Using cover letter template: {cover_letter_path}")
         
+        # Load the templates once and reuse them for every job
+        resume_data = self.load_resume(resume_path)
+        cover_letter_data = self.load_cover_letter(cover_letter_path)
+        
         # Process each job description
-        job_desc_files = list(job_desc_dir.glob("*.txt"))
+        job_desc_files = _find_inputs(job_desc_dir, (".txt",))
+        
+        # Spread the work over several processes when there is more than one job
+        workers = min(self._worker_count(), len(job_desc_files))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(type(self), self.config, self._worker_state(),
+                                               resume_path, cover_letter_path)) as executor:
+                # Hand each worker one chunk of files so spaCy can batch them
+                chunk_size = -(-len(job_desc_files) // workers)
+                chunks = [job_desc_files[i:i + chunk_size] for i in range(0, len(job_desc_files), chunk_size)]
+                job_names = [job_file.stem for job_file in job_desc_files]
+                job_infos = [info for infos in executor.map(_load_jobs_in_worker, chunks) for info in infos]
+                jobs = dict(zip(job_names, job_infos))
+                
+                # Fetch OpenAI output for all jobs up front in a few combined requests
+                precomputed = self._batch_tailor(resume_data, jobs)
+                
+                return list(executor.map(_process_job_in_worker, jobs, jobs.values(),
+                                         [precomputed.get(job_name) for job_name in jobs]))
         
-        results = []
         for job_file in job_desc_files:
-            job_name = job_file.stem
-            result = self.process_job(resume_path, cover_letter_path, job_file, job_name)
+            print(f"Processing job: {job_file.stem}")
+        jobs = dict(zip((job_file.stem for job_file in job_desc_files),
+                        self.load_job_descriptions(job_desc_files)))
+        
+        # Fetch OpenAI output for all jobs up front in a few combined requests
+        precomputed = self._batch_tailor(resume_data, jobs)
+        
+        results = []
+        for job_name, job_data in jobs.items():
+            result = self.process_job_preloaded(resume_data, cover_letter_data, job_data, job_name,
+                                                precomputed.get(job_name))
             results.append(result)
             
         return results
 
+# Worker process state for process_all_jobs. DOCX documents can't be pickled,
+# so each worker loads its own copy of the templates once at startup.
+_worker_tailorer = None
+_worker_templates = None
+
+def _init_worker(tailorer_class, config, state, resume_path, cover_letter_path):
+    """Create a tailorer like the parent's and load the templates in a worker process
+    
+    state is the parent's _worker_state(), so workers read and write the same locations.
+    """
+    global _worker_tailorer, _worker_templates
+    _worker_tailorer = tailorer_class(config)
+    for name, value in state.items():
+        setattr(_worker_tailorer, name, value)
+    _worker_templates = (_worker_tailorer.load_resume(resume_path),
+                         _worker_tailorer.load_cover_letter(cover_letter_path))
+
+def _load_jobs_in_worker(job_files):
+    """Load and analyze a chunk of job descriptions in a worker process"""
+    for job_file in job_files:
+        print(f"Processing job: {job_file.stem}")
+    return _worker_tailorer.load_job_descriptions(job_files)
+
+def _process_job_in_worker(job_name, job_data, precomputed):
+    """Generate and save the tailored documents for one job in a worker process"""
+    resume_data, cover_letter_data = _worker_templates
+    return _worker_tailorer.process_job_preloaded(resume_data, cover_letter_data, job_data, job_name,
+                                                  precomputed)
+
 def main():
     parser = argparse.ArgumentParser(description='Tailor resumes and cover letters for job applications')
     parser.add_argument('--config', help='Path to configuration file')
     parser.add_argument('--job', help='Process a specific job (by name or file path)')
+    parser.add_argument('--batch', action='store_true',
+                        help='Send OpenAI requests through the Batch API (cheaper, but slower)')
     args = parser.parse_args()
+    if args.batch and args.job:
+        parser.error("--batch only applies when processing all jobs; it can't be combined with --job")
+    
+    # Load API keys etc. from an env file
+    try:
+        from load_env import main as load_env
+        load_env()
+    except ImportError:
+        print("Environment loader not found. OpenAI features may not work.")
     
     config = {}
     if args.config:
         with open(args.config, 'r') as f:
             config = json.load(f)
+        
+        # Fail fast on a malformed config rather than partway through processing
+        validator = _config_validator()
+        if validator is not None:
+            errors = sorted(validator.iter_errors(config), key=lambda e: list(e.path))
+            if errors:
+                print(f"Invalid configuration file: {args.config}")
+                for error in errors:
+                    location = "/".join(str(p) for p in error.path) or "(root)"
+                    print(f"  {location}: {error.message}")
+                return
+    
+    if args.batch:
+        config.setdefault("openai_settings", {})["use_batch_api"] = True
     
     tailorer = DocumentTailorer(config)
     
@@ -380,8 +1171,8 @@ def main():
         resume_dir = Path("input/resumes")
         cover_letter_dir = Path("input/cover_letters")
         
-        resume_files = list(resume_dir.glob("*.docx")) + list(resume_dir.glob("*.pdf"))
-        cover_letter_files = list(cover_letter_dir.glob("*.docx"))
+        resume_files = _find_inputs(resume_dir, RESUME_SUFFIXES)
+        cover_letter_files = _find_inputs(cover_letter_dir, COVER_LETTER_SUFFIXES)
         
         if not resume_files or not cover_letter_files:
             print("Missing resume or cover letter templates in input directories")